@@ -14,8 +14,213 @@ bl_info = {
     "category": "Object",
 }
 
+import math
+import os
+import stat
+import traceback
+from functools import lru_cache
+
+import bmesh
 import bpy
-from mathutils import Vector
+import numpy as np
+from bpy.app.handlers import persistent
+from mathutils import Matrix, Vector
+
+
+# Cavity meshes above this triangle count are decimated before the boolean
+_CAVITY_MAX_TRIANGLES = 20000
+# Cavity meshes below this triangle count use the FAST boolean solver, larger ones EXACT
+_FAST_SOLVER_MAX_TRIANGLES = 5000
+
+# Meshes above this face count get cube projection instead of Smart UV Project
+_SMART_PROJECT_MAX_FACES = 10000
+
+def _bbox_np(obj):
+    """Return an object's local bounding box corners as an (8, 3) float32 array"""
+    return np.array(obj.bound_box, dtype=np.float32)
+
+
+def _triangle_count(mesh):
+    """Return the number of triangles a mesh's polygons tessellate into"""
+    n = len(mesh.polygons)
+    loop_totals = np.empty(n, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(loop_totals.sum()) - 2 * n
+
+
+def _world_bbox(obj):
+    """Return the world-space (min, max, center) of an object's mesh
+    
+    Pass the evaluated object (obj.evaluated_get(depsgraph)) so modifiers and
+    shape keys are included. The result is computed from the actual vertices,
+    so it stays tight under rotation.
+    
+    Deliberately not memoized: the world AABB of rotated vertices depends on more
+    than any cheap key (matrix, local bbox), and one foreach_get pass costs less
+    than keeping a cache correct across edits and animation.
+    """
+    matrix_world = np.array(obj.matrix_world, dtype=np.float32)
+    # Pull all vertex coordinates in one bulk transfer, transform and reduce per column
+    mesh = obj.to_mesh()
+    try:
+        n = len(mesh.vertices)
+        if n:
+            co = np.empty(n * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            co = co.reshape(n, 3)
+        else:
+            co = _bbox_np(obj)
+    finally:
+        obj.to_mesh_clear()
+    world = co @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+    bbox_min = Vector(world.min(axis=0))
+    bbox_max = Vector(world.max(axis=0))
+    return bbox_min, bbox_max, (bbox_min + bbox_max) / 2
+
+
+def _create_box(context, name, location, size, bake_size=False):
+    """Create a box mesh object without going through primitive_cube_add
+    
+    The box is a unit cube scaled to size, either through object scale or,
+    with bake_size, directly in the geometry. It becomes the only selected
+    and the active object, like an added primitive.
+    """
+    if bake_size:
+        matrix = Matrix.Diagonal(Vector(size).to_4d())
+    else:
+        matrix = Matrix.Identity(4)
+    
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    # Give the box a UV map, like primitive_cube_add does
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_cube(bm, size=1.0, matrix=matrix, calc_uvs=True)
+    bm.to_mesh(mesh)
+    bm.free()
+    
+    box_obj = bpy.data.objects.new(name, mesh)
+    context.collection.objects.link(box_obj)
+    box_obj.location = location
+    if not bake_size:
+        box_obj.scale = size
+    
+    for selected in context.selected_objects:
+        selected.select_set(False)
+    box_obj.select_set(True)
+    context.view_layer.objects.active = box_obj
+    return box_obj
+
+
+# Index of loaded images, {absolute file path: image name}
+# Self-healing: _find_image rescans on a miss or stale entry, so no update handler is needed
+_image_index = {}
+
+
+# Set while a coalesced 3D viewport redraw is waiting on the timer
+_pending_redraw = False
+
+
+def _flush_redraw():
+    """Timer callback: redraw every 3D viewport once for all pending requests"""
+    global _pending_redraw
+    _pending_redraw = False
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+
+def _request_redraw():
+    """Schedule a single 3D viewport redraw, merging requests made before it runs"""
+    global _pending_redraw
+    if not _pending_redraw:
+        _pending_redraw = True
+        bpy.app.timers.register(_flush_redraw, first_interval=0)
+
+
+def _find_view3d_area(context):
+    """Return the 3D viewport area to update, preferring the one the operator ran from"""
+    if context.area is not None and context.area.type == 'VIEW_3D':
+        return context.area
+    if context.screen is None:
+        return None
+    return next((area for area in context.screen.areas if area.type == 'VIEW_3D'), None)
+
+
+@lru_cache(maxsize=512)
+def _abspath_raw(raw):
+    """Resolve a datablock file path (possibly blend-relative //) to an absolute path"""
+    return os.path.abspath(bpy.path.abspath(raw)) if raw else ""
+
+
+def _image_abspath(img):
+    """Return the absolute file path an image datablock was loaded from"""
+    return _abspath_raw(img.filepath_raw or img.filepath)
+
+
+def _rebuild_image_index():
+    """Walk bpy.data.images once and rebuild the path -> name index"""
+    _image_index.clear()
+    for img in bpy.data.images:
+        try:
+            path = _image_abspath(img)
+        except Exception:
+            continue
+        if path:
+            _image_index.setdefault(path, img.name)
+
+
+def _image_matches(img, abs_path):
+    """Check whether an image datablock points at the given absolute path"""
+    return img.filepath == abs_path or _abspath_raw(img.filepath_raw) == abs_path
+
+
+@lru_cache(maxsize=32)
+def _normalize_image_path(path):
+    """Expand ~, environment variables and relative parts of a path, return (absolute path, basename)"""
+    abs_path = os.path.abspath(os.path.expanduser(os.path.expandvars(path.strip())))
+    return abs_path, os.path.basename(abs_path)
+
+
+def _find_image(abs_path):
+    """Look up an already loaded image by absolute path through the image index"""
+    name = _image_index.get(abs_path)
+    if name is not None:
+        image = bpy.data.images.get(name)
+        if image is not None and _image_matches(image, abs_path):
+            return image
+    
+    # Index miss or stale entry (renamed, removed or repointed image), rescan and repopulate
+    _rebuild_image_index()
+    name = _image_index.get(abs_path)
+    return bpy.data.images.get(name) if name is not None else None
+
+
+@persistent
+def _clear_image_cache(*args):
+    """Drop cached paths and the image index when a .blend file is loaded or saved"""
+    # Blend-relative paths resolve against the file location, which may have changed
+    # The index is repopulated lazily by the next _find_image miss
+    _abspath_raw.cache_clear()
+    _image_index.clear()
+
+
+def _remove_handler(handlers, func):
+    """Remove func from an app handler list, including copies from earlier loads of this module
+    
+    The addon is loaded with exec_module, so each load creates new function objects;
+    matching by module and name also catches the stale ones.
+    """
+    for handler in list(handlers):
+        if getattr(handler, "__module__", None) == func.__module__ and getattr(handler, "__name__", None) == func.__name__:
+            handlers.remove(handler)
+
+
+def _add_handler(handlers, func):
+    """Append func to an app handler list, replacing any copy from an earlier load"""
+    _remove_handler(handlers, func)
+    handlers.append(func)
 
 
 class OBJECT_OT_AddTexture(bpy.types.Operator):
@@ -31,6 +236,17 @@ class OBJECT_OT_AddTexture(bpy.types.Operator):
         subtype='FILE_PATH'
     )
 
+    uv_method: bpy.props.EnumProperty(
+        name="UV Method",
+        description="How to create UV coordinates when the mesh has none",
+        items=[
+            ('AUTO', "Auto", "Smart UV Project for small meshes, Cube Projection for large ones"),
+            ('SMART', "Smart UV Project", "Angle-based islands, slow on dense meshes"),
+            ('CUBE', "Cube Projection", "Box projection, linear in face count"),
+        ],
+        default='AUTO'
+    )
+
     @classmethod
     def poll(cls, context):
         """Only enable if there's an active object and it's a mesh"""
@@ -42,8 +258,6 @@ class OBJECT_OT_AddTexture(bpy.types.Operator):
     def execute(self, context):
         """Load image and apply as texture to the mesh"""
         try:
-            import os
-            
             obj = context.active_object
             
             if obj is None or obj.type != 'MESH':
@@ -56,11 +270,14 @@ class OBJECT_OT_AddTexture(bpy.types.Operator):
                 return {'CANCELLED'}
             
             # Expand path (handle ~ and relative paths)
-            image_path = os.path.expanduser(os.path.expandvars(self.image_path))
-            image_path = os.path.abspath(image_path)
+            image_path, image_name = _normalize_image_path(self.image_path)
             
-            # Check if file exists
-            if not os.path.exists(image_path):
+            # Check if file exists (single stat, also rejects directories)
+            try:
+                image_stat = os.stat(image_path)
+            except OSError:
+                image_stat = None
+            if image_stat is None or not stat.S_ISREG(image_stat.st_mode):
                 self.report({'ERROR'}, f"Image file not found: {image_path}")
                 return {'CANCELLED'}
             
@@ -71,18 +288,16 @@ class OBJECT_OT_AddTexture(bpy.types.Operator):
             # Load the image
             try:
                 # Check if image is already loaded
-                image_name = os.path.basename(image_path)
-                image = None
-                for img in bpy.data.images:
-                    if img.filepath == image_path or (img.filepath_raw and os.path.abspath(bpy.path.abspath(img.filepath_raw)) == image_path):
-                        image = img
-                        break
+                image = _find_image(image_path)
                 
                 if image is None:
                     image = bpy.data.images.load(image_path)
-                else:
-                    # Reload if it exists
+                    _image_index[image_path] = image.name
+                    image["_cached_mtime"] = image_stat.st_mtime
+                elif image.get("_cached_mtime", 0.0) != image_stat.st_mtime:
+                    # Reload only if the file changed on disk since it was last decoded
                     image.reload()
+                    image["_cached_mtime"] = image_stat.st_mtime
                 
             except Exception as e:
                 self.report({'ERROR'}, f"Failed to load image: {str(e)}")
@@ -115,36 +330,38 @@ class OBJECT_OT_AddTexture(bpy.types.Operator):
             links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
             
             # Check if mesh has UV coordinates, create if needed
+            # Meshes that already have UVs skip Edit mode entirely
             mesh = obj.data
-            current_mode = context.mode
             
             if not mesh.uv_layers:
                 # No UV coordinates - create them
-                # Ensure we're in Object mode
-                if current_mode != 'OBJECT':
-                    bpy.ops.object.mode_set(mode='OBJECT')
+                # Smart Project scales badly with face count, use Cube Projection for dense meshes
+                # Decided in Object mode, where mesh data is in sync
+                uv_method = self.uv_method
+                if uv_method == 'AUTO':
+                    uv_method = 'SMART' if len(mesh.polygons) < _SMART_PROJECT_MAX_FACES else 'CUBE'
+                if uv_method == 'CUBE':
+                    cube_size = float(np.ptp(_bbox_np(obj), axis=0).max()) or 1.0
                 
-                # Select object and enter Edit mode
-                bpy.ops.object.select_all(action='DESELECT')
+                # Make the mesh the only selected object so Edit mode doesn't pull in others
+                for selected in context.selected_objects:
+                    selected.select_set(False)
                 obj.select_set(True)
                 context.view_layer.objects.active = obj
-                bpy.ops.object.mode_set(mode='EDIT')
                 
-                # Select all faces
-                bpy.ops.mesh.select_all(action='SELECT')
-                
-                # Unwrap using Smart Project or Angle Based
+                # Single Edit mode session: select all faces and unwrap back-to-back
+                # (we're already in Object mode from the check above)
+                bpy.ops.object.mode_set(mode='EDIT')
                 try:
-                    bpy.ops.uv.smart_project()
-                except:
-                    try:
-                        bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
-                    except:
-                        # Fallback: simple unwrap
-                        bpy.ops.uv.unwrap(method='CONFORMAL', margin=0.001)
+                    bpy.ops.mesh.select_all(action='SELECT')
+                    if uv_method == 'SMART':
+                        bpy.ops.uv.smart_project(angle_limit=math.radians(66))
+                    else:
+                        bpy.ops.uv.cube_project(cube_size=cube_size)
+                finally:
+                    # Never leave the object stuck in Edit mode if unwrapping fails
+                    bpy.ops.object.mode_set(mode='OBJECT')
                 
-                # Return to original mode or Object mode
-                bpy.ops.object.mode_set(mode='OBJECT')
                 self.report({'INFO'}, "Created UV coordinates for mesh")
             
             # Create UV Map node (must come before Image Texture)
@@ -178,21 +395,16 @@ class OBJECT_OT_AddTexture(bpy.types.Operator):
                 obj.data.materials.append(material)
             
             # Set viewport shading to Material Preview to see the texture
-            for area in context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            space.shading.type = 'MATERIAL'
-                            area.tag_redraw()
-                            break
-                    break
-            
-            self.report({'INFO'}, f"Texture applied: {os.path.basename(image_path)}")
+            area = _find_view3d_area(context)
+            if area is not None:
+                area.spaces.active.shading.type = 'MATERIAL'
+                _request_redraw()
+            
+            self.report({'INFO'}, f"Texture applied: {image_name}")
             return {'FINISHED'}
             
         except Exception as e:
             self.report({'ERROR'}, f"Error adding texture: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {'CANCELLED'}
 
@@ -240,22 +452,10 @@ class OBJECT_OT_CreateFittingRectangle(bpy.types.Operator):
             if context.mode != 'OBJECT':
                 bpy.ops.object.mode_set(mode='OBJECT')
             
-            # Calculate bounding box of the selected mesh
-            # Get all corners in world space
-            matrix_world = obj.matrix_world
-            bbox_corners = [matrix_world @ Vector(corner) for corner in obj.bound_box]
-            
-            # Find min and max in each axis
-            bbox_min = Vector((
-                min(c.x for c in bbox_corners),
-                min(c.y for c in bbox_corners),
-                min(c.z for c in bbox_corners)
-            ))
-            bbox_max = Vector((
-                max(c.x for c in bbox_corners),
-                max(c.y for c in bbox_corners),
-                max(c.z for c in bbox_corners)
-            ))
+            # Calculate bounding box of the selected mesh in world space
+            # Use the evaluated mesh so modifiers and shape keys are accounted for
+            obj_eval = obj.evaluated_get(context.evaluated_depsgraph_get())
+            bbox_min, bbox_max, bbox_center = _world_bbox(obj_eval)
             
             # Calculate size with padding (for all 3 dimensions to create a box)
             bbox_size = bbox_max - bbox_min
@@ -263,28 +463,20 @@ class OBJECT_OT_CreateFittingRectangle(bpy.types.Operator):
             box_length = bbox_size.y + (self.padding * 2)
             box_height = bbox_size.z + (self.padding * 2)
             
-            # Create a cube/box that fits the mesh
-            # Create a unit cube (size=1 means 1 unit per side, so scale will be direct)
-            bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-            
-            box_obj = context.active_object
-            box_obj.name = f"{obj.name}_FittingBox"
-            
-            # Scale the cube to match the exact box dimensions
-            # Since we start with size=1, we scale directly by the dimensions
-            box_obj.scale.x = box_width
-            box_obj.scale.y = box_length
-            box_obj.scale.z = box_height
-            
             # Calculate offset to place box beside the mesh (to the right on X axis)
-            mesh_center_x = (bbox_min.x + bbox_max.x) / 2
+            mesh_center_x = bbox_center.x
             mesh_size_x = bbox_max.x - bbox_min.x
             box_center_x = mesh_center_x + (mesh_size_x / 2) + (box_width / 2) + self.side_spacing
             
-            # Position the box (centered on mesh's Y and Z, offset on X)
-            box_obj.location.x = box_center_x
-            box_obj.location.y = (bbox_min.y + bbox_max.y) / 2
-            box_obj.location.z = (bbox_min.z + bbox_max.z) / 2
+            # Create a cube/box that fits the mesh
+            # A unit cube scaled by the exact box dimensions, so scale is the box size
+            # Positioned centered on mesh's Y and Z, offset on X
+            box_obj = _create_box(
+                context,
+                f"{obj.name}_FittingBox",
+                (box_center_x, bbox_center.y, bbox_center.z),
+                (box_width, box_length, box_height)
+            )
             
             # Select both objects
             obj.select_set(True)
@@ -296,7 +488,6 @@ class OBJECT_OT_CreateFittingRectangle(bpy.types.Operator):
             
         except Exception as e:
             self.report({'ERROR'}, f"Error creating box: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {'CANCELLED'}
 
@@ -341,25 +532,20 @@ class OBJECT_OT_CreateMouldBox(bpy.types.Operator):
             if context.mode != 'OBJECT':
                 bpy.ops.object.mode_set(mode='OBJECT')
             
-            # Deselect all
-            bpy.ops.object.select_all(action='DESELECT')
+            # Deselect all (direct data access, no operator round-trip)
+            for selected in context.selected_objects:
+                selected.select_set(False)
             
             # Calculate where mould box should be positioned (around the original mesh)
             # CRITICAL: The mould box must be positioned AROUND the mesh, not beside it
             # This is the key to making the boolean operation work - they must overlap
             # Get the original mesh center in world space
-            obj_bbox = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            obj_min = Vector((
-                min(c.x for c in obj_bbox),
-                min(c.y for c in obj_bbox),
-                min(c.z for c in obj_bbox)
-            ))
-            obj_max = Vector((
-                max(c.x for c in obj_bbox),
-                max(c.y for c in obj_bbox),
-                max(c.z for c in obj_bbox)
-            ))
-            obj_center = (obj_min + obj_max) / 2
+            # Use the evaluated mesh so modifiers and shape keys are accounted for
+            obj_eval = obj.evaluated_get(context.evaluated_depsgraph_get())
+            obj_local_bbox = _bbox_np(obj_eval)
+            obj_min, obj_max, obj_center = _world_bbox(obj_eval)
+            # The mesh copy keeps the source's modifiers, so count what they evaluate to
+            triangle_count = _triangle_count(obj_eval.data)
             
             # Get fitting box dimensions (scale values)
             fitting_box_width = fitting_box.scale.x * 2  # Scale * 2 for size=1 cube
@@ -368,61 +554,84 @@ class OBJECT_OT_CreateMouldBox(bpy.types.Operator):
             
             # Create a SOLID box for the mould (following video technique at 3:57)
             # Create a new cube and position it around the mesh
-            bpy.ops.mesh.primitive_cube_add(size=1, location=obj_center)
-            
-            mould_box = context.active_object
-            mould_box.name = f"{obj.name}_MouldBox"
-            
-            # Scale the cube to match fitting box dimensions (solid box)
-            fitting_box_scale = fitting_box.scale.copy()
-            mould_box.scale = fitting_box_scale
-            
-            # Apply scale to make it a solid box (bake scale into geometry)
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-            
-            # Get mould box top position to position mesh trespassing through it
-            mould_box_bbox = [mould_box.matrix_world @ Vector(corner) for corner in mould_box.bound_box]
-            mould_box_top_z = max(c.z for c in mould_box_bbox)
-            mould_box_bottom_z = min(c.z for c in mould_box_bbox)
+            # Scale the cube to match fitting box dimensions (solid box), baked into the geometry
+            fitting_box_scale = fitting_box.scale[:]
+            mould_box = _create_box(
+                context,
+                f"{obj.name}_MouldBox",
+                obj_center,
+                fitting_box_scale,
+                bake_size=True
+            )
+            
+            # Get mould box bounds to position mesh trespassing through it
+            # The box is a unit cube scaled by the fitting box, centered on the mesh
+            mould_box_size = Vector(fitting_box_scale)
+            mould_box_min = obj_center - mould_box_size / 2
+            mould_box_max = obj_center + mould_box_size / 2
+            mould_box_top_z = mould_box_max.z
+            mould_box_bottom_z = mould_box_min.z
             mould_box_height = mould_box_top_z - mould_box_bottom_z
             
             # Get original mesh bounds to calculate how much it extends
-            obj_bbox = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            obj_bottom_z = min(c.z for c in obj_bbox)
-            obj_top_z = max(c.z for c in obj_bbox)
+            obj_bottom_z = obj_min.z
+            obj_top_z = obj_max.z
             obj_height = obj_top_z - obj_bottom_z
             
-            # Now duplicate the mesh and position it so it trespasses the top part of the box
-            obj.select_set(True)
-            mould_box.select_set(False)
-            context.view_layer.objects.active = obj
-            bpy.ops.object.duplicate()
+            # Make sure both are in the same collection
+            if mould_box.users_collection:
+                target_collection = mould_box.users_collection[0]
+            else:
+                target_collection = context.collection
             
-            mesh_copy = context.active_object
+            # Now duplicate the mesh through the data API (no duplicate operator)
+            mesh_copy = obj.copy()
+            mesh_copy.data = obj.data.copy()
             mesh_copy.name = f"{obj.name}_MouldMesh"
+            target_collection.objects.link(mesh_copy)
+            
+            # Pre-simplify dense cavity meshes, boolean cost grows superlinearly with triangles
+            # Decimate's ratio is a fraction of triangles, so compare triangle counts
+            if triangle_count > _CAVITY_MAX_TRIANGLES:
+                decimate_mod = mesh_copy.modifiers.new(name="CavityDecimate", type='DECIMATE')
+                decimate_mod.ratio = _CAVITY_MAX_TRIANGLES / triangle_count
+                depsgraph = context.evaluated_depsgraph_get()
+                decimated_mesh = bpy.data.meshes.new_from_object(mesh_copy.evaluated_get(depsgraph))
+                # Every modifier is baked into the new mesh now
+                mesh_copy.modifiers.clear()
+                old_mesh = mesh_copy.data
+                mesh_copy.data = decimated_mesh
+                bpy.data.meshes.remove(old_mesh)
+                triangle_count = _triangle_count(decimated_mesh)
+                self.report({'INFO'}, f"Decimated cavity mesh to {triangle_count} triangles")
             
             # Copy mesh and position it relative to MOULD BOX (not original mesh)
             # Position it so it trespasses the top part of the box
             
             # Get mesh local bounds for positioning
-            obj_local_bbox = [Vector(corner) for corner in obj.bound_box]
-            obj_local_min_z = min(c.z for c in obj_local_bbox)
-            obj_local_max_z = max(c.z for c in obj_local_bbox)
+            # Reuses the local corners read above
+            obj_local_min_z = float(obj_local_bbox[:, 2].min())
+            obj_local_max_z = float(obj_local_bbox[:, 2].max())
             obj_local_height = obj_local_max_z - obj_local_min_z
             obj_local_center_offset_z = (obj_local_min_z + obj_local_max_z) / 2
             
             # Position mesh copy relative to mould box - trespassing the top
             mesh_top_position_z = mould_box_top_z + (obj_local_height / 2) - obj_local_center_offset_z
-            mesh_copy.location = Vector((
+            mesh_copy_location = Vector((
                 mould_box.location.x,  # Centered on mould box
                 mould_box.location.y,  # Centered on mould box
                 mesh_top_position_z    # Extends above box top
             ))
-            mesh_copy.rotation_euler = mould_box.rotation_euler.copy()
-            mesh_copy.scale = mould_box.scale.copy()
+            mesh_copy_matrix = Matrix.LocRotScale(
+                mesh_copy_location,
+                mould_box.rotation_euler,
+                mould_box.scale[:]
+            )
             
-            # Apply transforms on mesh copy
-            bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+            # Apply transforms on mesh copy by baking them into its vertices
+            # shape_keys=True keeps key blocks in sync, otherwise they'd override the baked positions
+            mesh_copy.data.transform(mesh_copy_matrix, shape_keys=True)
+            mesh_copy.matrix_world = Matrix.Identity(4)
             
             # Ensure both objects are visible
             mould_box.hide_set(False)
@@ -430,36 +639,32 @@ class OBJECT_OT_CreateMouldBox(bpy.types.Operator):
             mesh_copy.hide_set(False)
             mesh_copy.hide_viewport = False
             
-            # Make sure both are in the same collection
-            if mould_box.users_collection:
-                target_collection = mould_box.users_collection[0]
-                if mesh_copy.name not in target_collection.objects:
-                    target_collection.objects.link(mesh_copy)
-            
             # Apply boolean difference to subtract mesh from box (creates cavity)
-            bpy.ops.object.select_all(action='DESELECT')
             mould_box.select_set(True)
             mesh_copy.select_set(True)
             context.view_layer.objects.active = mould_box
             
-            context.view_layer.update()
-            bpy.context.view_layer.depsgraph.update()
-            
             bool_mod = mould_box.modifiers.new(name="BooleanCavity", type='BOOLEAN')
             bool_mod.operation = 'DIFFERENCE'
             bool_mod.object = mesh_copy
-            bool_mod.solver = 'FAST'
+            bool_mod.solver = 'FAST' if triangle_count < _FAST_SOLVER_MAX_TRIANGLES else 'EXACT'
             bool_mod.use_self = False
             
-            mould_box.update_tag()
-            context.view_layer.update()
-            bpy.context.view_layer.depsgraph.update()
-            
             # Apply the boolean modifier to create the cavity
-            result = bpy.ops.object.modifier_apply(modifier="BooleanCavity")
-            
-            if 'FINISHED' not in result:
-                self.report({'WARNING'}, f"Boolean operation failed: {result}")
+            # A single depsgraph evaluation covers every change made above
+            depsgraph = context.evaluated_depsgraph_get()
+            mould_box_eval = mould_box.evaluated_get(depsgraph)
+            cavity_mesh = bpy.data.meshes.new_from_object(mould_box_eval)
+            
+            old_mesh = mould_box.data
+            old_mesh_name = old_mesh.name
+            mould_box.modifiers.remove(bool_mod)
+            mould_box.data = cavity_mesh
+            bpy.data.meshes.remove(old_mesh)
+            cavity_mesh.name = old_mesh_name
+            
+            if not cavity_mesh.polygons:
+                self.report({'WARNING'}, "Boolean operation failed: empty result")
             else:
                 self.report({'INFO'}, "Boolean cavity created successfully")
             
@@ -468,13 +673,7 @@ class OBJECT_OT_CreateMouldBox(bpy.types.Operator):
             
             
             # Position mould box beside the fitting box (after boolean operations are done)
-            # Calculate final position
-            mould_box_bbox = [mould_box.matrix_world @ Vector(corner) for corner in mould_box.bound_box]
-            mould_box_size = Vector((
-                max(c.x for c in mould_box_bbox) - min(c.x for c in mould_box_bbox),
-                max(c.y for c in mould_box_bbox) - min(c.y for c in mould_box_bbox),
-                max(c.z for c in mould_box_bbox) - min(c.z for c in mould_box_bbox)
-            ))
+            # The cavity doesn't change the outer extents, so reuse the size from above
             
             # Calculate offset to move both mould box and mesh copy together
             offset_x = (fitting_box.location.x + mould_box_size.x + 1.0) - mould_box.location.x
@@ -492,7 +691,6 @@ class OBJECT_OT_CreateMouldBox(bpy.types.Operator):
             
         except Exception as e:
             self.report({'ERROR'}, f"Error creating mould box: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {'CANCELLED'}
 
@@ -604,17 +802,19 @@ def register():
         print("[FUNCTIONS] Adding menu items...")
         bpy.types.VIEW3D_MT_object.append(menu_func)
         
+        # Invalidate cached image lookups whenever a .blend file is loaded or saved
+        # (bpy.data isn't touched here, it can be restricted while add-ons are enabled)
+        _add_handler(bpy.app.handlers.load_post, _clear_image_cache)
+        _add_handler(bpy.app.handlers.save_post, _clear_image_cache)
+        
         # Force UI refresh to show the panel
         print("[FUNCTIONS] Refreshing UI...")
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        _request_redraw()
         
         print("[FUNCTIONS] ✓ Registration complete!")
         print("✓ Registered: Object Inspector panel should appear in sidebar 'object_inspector' tab")
     except Exception as e:
         print(f"[FUNCTIONS] ERROR during registration: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -627,6 +827,16 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_INSPECTOR_TexturePath)
     bpy.types.VIEW3D_MT_object.remove(menu_func)
     
+    _remove_handler(bpy.app.handlers.load_post, _clear_image_cache)
+    _remove_handler(bpy.app.handlers.save_post, _clear_image_cache)
+    _abspath_raw.cache_clear()
+    _image_index.clear()
+    
+    global _pending_redraw
+    if bpy.app.timers.is_registered(_flush_redraw):
+        bpy.app.timers.unregister(_flush_redraw)
+    _pending_redraw = False
+    
     # Remove scene property
     if hasattr(bpy.types.Scene, "object_inspector_texture_path"):
         del bpy.types.Scene.object_inspector_texture_path
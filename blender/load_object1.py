@@ -19,6 +19,40 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)  # Go up from blender/ to project root
 glb_path = os.path.join(project_root, "3d", "object1.glb")
 
+# Collection holding the imported objects, and the scene properties that remember it
+import_collection_name = "object_1_glb"
+import_collection_prop = "object_inspector_import_collection"
+import_mtime_prop = "object_inspector_import_mtime"
+
+
+def get_previous_import(scene):
+    """Return the collection from a previous import of the same .glb, or None"""
+    collection_name = scene.get(import_collection_prop)
+    if not collection_name:
+        return None
+    collection = bpy.data.collections.get(collection_name)
+    if collection is None or not collection.all_objects:
+        return None
+    # Re-import if the .glb changed on disk since it was imported
+    if scene.get(import_mtime_prop) != os.path.getmtime(glb_path):
+        return None
+    return collection
+
+
+def clear_scene_objects(scene, keep=None):
+    """Remove all objects from the scene in one batch, except those in the keep collection"""
+    objects = [obj for obj in scene.collection.all_objects
+               if keep is None or obj.name not in keep.all_objects]
+    # Objects also used by other scenes are only unlinked from this one
+    shared = [obj for obj in objects if len(obj.users_scene) > 1]
+    scene_collections = [scene.collection, *scene.collection.children_recursive]
+    for obj in shared:
+        for users_collection in obj.users_collection:
+            if users_collection in scene_collections:
+                users_collection.objects.unlink(obj)
+    bpy.data.batch_remove(ids=[obj for obj in objects if obj not in shared])
+
+
 def create_scene_and_import():
     """Create new scene called 'object_1' and import the .glb file"""
     
@@ -34,17 +68,27 @@ def create_scene_and_import():
     if scene_name in bpy.data.scenes:
         scene = bpy.data.scenes[scene_name]
         bpy.context.window.scene = scene
-        # Clear existing objects
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        
+        # Reuse the datablocks from a previous import instead of parsing the .glb again
+        collection = get_previous_import(scene)
+        if collection is not None:
+            print(f"Reusing previously imported objects from collection: {collection.name}")
+            if collection.name not in scene.collection.children:
+                scene.collection.children.link(collection)
+            # Clear everything else in the scene
+            clear_scene_objects(scene, keep=collection)
+            try:
+                bpy.ops.view3d.view_all()
+            except Exception:
+                pass
+            return True
     else:
         # Create new scene
         scene = bpy.data.scenes.new(name=scene_name)
         bpy.context.window.scene = scene
     
-    # Clear the default cube, light, and camera
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    # Clear existing objects (default cube, light, and camera) in a single pass
+    clear_scene_objects(scene)
     
     # Import the .glb file
     try:
@@ -53,6 +97,20 @@ def create_scene_and_import():
         bpy.ops.import_scene.gltf(filepath=glb_path)
         print("Successfully imported GLB file!")
         
+        # Move the imported objects into their own collection so later runs can reuse them
+        # A stale collection from an earlier import was emptied above, so reuse it
+        collection = bpy.data.collections.get(scene.get(import_collection_prop, ""))
+        if collection is None:
+            collection = bpy.data.collections.new(import_collection_name)
+        if collection.name not in scene.collection.children:
+            scene.collection.children.link(collection)
+        for obj in bpy.context.selected_objects:
+            for users_collection in obj.users_collection:
+                users_collection.objects.unlink(obj)
+            collection.objects.link(obj)
+        scene[import_collection_prop] = collection.name
+        scene[import_mtime_prop] = os.path.getmtime(glb_path)
+        
         # Frame the imported objects in the viewport
         bpy.ops.view3d.view_all()
         